@@ -1,9 +1,67 @@
 """Command line interface for Tianzige."""
 
 import argparse
+import io
+import multiprocessing
 import sys
 import os
-from . import __version__, create_tianzige
+from concurrent.futures import ProcessPoolExecutor
+from reportlab.pdfgen import canvas
+from reportlab.lib.units import mm
+from . import __version__
+from .core import PAGE_SIZES, create_tianzige
+
+# Prefer fork so workers inherit the parent's warm reportlab state
+# rather than re-importing everything, and so the behavior does not
+# shift with the platform's default start method. Fall back to the
+# platform default where fork is unavailable (e.g. Windows).
+try:
+    _MP_CONTEXT = multiprocessing.get_context('fork')
+except ValueError:
+    _MP_CONTEXT = None
+
+def _template_fits(paper_size, square_size, margin_left, margin_right,
+                   margin_top, margin_bottom):
+    """Check whether at least one square fits on the page.
+
+    Pure arithmetic mirror of create_tianzige's size validation, so
+    non-viable (paper size, square size) combinations can be skipped
+    without touching reportlab or the filesystem.
+
+    Args:
+        paper_size: Page size key from PAGE_SIZES
+        square_size: Square size in mm
+        margin_left: Left margin in mm
+        margin_right: Right margin in mm
+        margin_top: Top margin in mm
+        margin_bottom: Bottom margin in mm
+
+    Returns:
+        True if the combination can produce a grid, False otherwise
+    """
+    page_width, page_height = PAGE_SIZES[paper_size]
+    square_size_pt = square_size * mm
+    if square_size_pt > min(page_width, page_height):
+        return False
+    available_width = page_width - (margin_left + margin_right) * mm
+    available_height = page_height - (margin_top + margin_bottom) * mm
+    return available_width >= square_size_pt and available_height >= square_size_pt
+
+def _render_template(job):
+    """Render a single template PDF in a worker process.
+
+    Args:
+        job: Tuple of create_tianzige arguments ending with the page size
+
+    Returns:
+        Tuple of (output_file, exception or None)
+    """
+    output_file = job[0]
+    try:
+        create_tianzige(*job)
+        return output_file, None
+    except Exception as e:
+        return output_file, e
 
 def main():
     """Entry point for the command line interface."""
@@ -64,25 +122,48 @@ Examples:
             templates_created = 0
             skipped = []
             
+            jobs = []
             for paper_size in paper_sizes:
                 for square_size in square_sizes:
-                    output_file = os.path.join(output_dir, f"tianzige_{paper_size}_{square_size}mm.pdf")
-                    try:
-                        create_tianzige(
-                            output_file,
-                            args.color,
-                            square_size,
-                            args.margin_top,
-                            args.margin_bottom,
-                            args.margin_left,
-                            args.margin_right,
-                            not args.no_inner_grid,
-                            paper_size
-                        )
-                        templates_created += 1
-                        print(f"Generated template: {output_file}")
-                    except ValueError as e:
+                    if not _template_fits(paper_size, square_size,
+                                          args.margin_left, args.margin_right,
+                                          args.margin_top, args.margin_bottom):
                         skipped.append(f"{paper_size} with {square_size}mm squares")
+                        continue
+                    jobs.append((
+                        os.path.join(output_dir, f"tianzige_{paper_size}_{square_size}mm.pdf"),
+                        args.color,
+                        square_size,
+                        args.margin_top,
+                        args.margin_bottom,
+                        args.margin_left,
+                        args.margin_right,
+                        not args.no_inner_grid,
+                        paper_size
+                    ))
+
+            # Pay reportlab's one-time setup (font registration etc.) in the
+            # parent. Workers inherit the warm state when the pool can fork
+            # (see _MP_CONTEXT); spawn-based platforms repeat it per worker.
+            canvas.Canvas(io.BytesIO())
+
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     mp_context=_MP_CONTEXT) as executor:
+                results = list(executor.map(_render_template, jobs))
+
+            messages = []
+            for job, (output_file, error) in zip(jobs, results):
+                if error is None:
+                    templates_created += 1
+                    messages.append(f"Generated template: {output_file}")
+                elif isinstance(error, ValueError):
+                    skipped.append(f"{job[-1]} with {job[2]}mm squares")
+                else:
+                    raise error
+
+            # One write for the whole batch instead of a syscall per line
+            if messages:
+                sys.stdout.write("\n".join(messages) + "\n")
             
             print(f"\nCreated {templates_created} template files in {output_dir}/")
             if skipped:
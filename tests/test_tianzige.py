@@ -12,7 +12,7 @@ from tianzige.core import (
     validate_hex_color,
     PAGE_SIZES
 )
-from tianzige.__main__ import main
+from tianzige.__main__ import main, _template_fits
 
 # Utility function tests
 def test_calculate_dimensions():
@@ -60,6 +60,7 @@ def test_validate_hex_color():
     assert validate_hex_color('#12345') is False   # Too short
     assert validate_hex_color('#1234567') is False # Too long
     assert validate_hex_color('#GHIJKL') is False  # Invalid characters
+    assert validate_hex_color('１２３４５６') is False  # Fullwidth digits
 
 # Basic functionality tests (existing)
 def test_create_tianzige_basic():
@@ -238,6 +239,29 @@ def test_square_size_too_large():
     with pytest.raises(ValueError):
         create_tianzige("test.pdf", square_size=1000)  # Unreasonably large
 
+def test_square_size_too_large_for_margins():
+    """Test with square size that fits the page but not the margins."""
+    output_file = "test_margins_misfit.pdf"
+    with pytest.raises(ValueError) as exc_info:
+        # 200mm fits A4's 210mm width but not the 190mm inside the margins
+        create_tianzige(
+            output_file,
+            square_size=200,
+            margin_left=10,
+            margin_right=10
+        )
+    assert "margins" in str(exc_info.value)
+    assert not os.path.exists(output_file)  # Error path touches no files
+
+def test_template_fits():
+    """Test the pure-arithmetic fit check used by --create-templates."""
+    # Comfortable fit with the CLI default margins
+    assert _template_fits('a4', 20, 20, 10, 15, 15) is True
+    # Square larger than the page itself
+    assert _template_fits('a6', 120, 0, 0, 0, 0) is False
+    # Square fits the page but not the space inside the margins
+    assert _template_fits('a4', 200, 10, 10, 10, 10) is False
+
 @patch('reportlab.pdfgen.canvas.Canvas.save')
 def test_file_system_error(mock_save):
     """Test handling of file system errors."""
@@ -290,7 +314,7 @@ def test_grid_drawing():
     output_file = "test_single_box.pdf"
     create_tianzige(
         output_file,
-        square_size=200,  # Large size to force single box
+        square_size=180,  # Large size to force single box
         margin_top=10,
         margin_bottom=10,
         margin_left=10,